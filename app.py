@@ -1,112 +1,315 @@
 from flask import Flask, jsonify, request, send_file
+from flask.json.provider import JSONProvider
+import msgspec
+import orjson
 import requests
+import hashlib
 import os
 import re
-from datetime import datetime
+import signal
+from datetime import datetime, timedelta
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter, Retry
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo.errors import ConnectionFailure, DuplicateKeyError, PyMongoError
 from bson import ObjectId
 app = Flask(__name__)
 
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which serializes much faster than
+    the stdlib json used by Flask's default provider"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonProvider(app)
+
+
 # MongoDB connection
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://mongodb:27017/")
 DB_NAME = os.getenv("DB_NAME", "petstore")
 STORE_ID = os.getenv("STORE_ID", "1")
 
-client = MongoClient(MONGO_URI)
-db = client[DB_NAME]  # Same database for all stores
-pet_types_collection = db.pet_types
-pets_collection = db.pets
+# The MongoClient is created lazily and per-process: if the app is preloaded
+# by gunicorn and then forked into workers, each worker builds its own client
+# (with its own socket pool and monitor threads) instead of inheriting the
+# parent's, which PyMongo does not support.
+_client = None
+
+def get_client():
+    """Return a MongoClient owned by the current process"""
+    global _client
+    if _client is None or getattr(_client, "_pid", None) != os.getpid():
+        # Bound the connection pool explicitly and fail fast when MongoDB is
+        # unreachable instead of hanging on the 30s driver defaults. zlib wire
+        # compression shrinks the larger list responses without extra packages.
+        _client = MongoClient(
+            MONGO_URI,
+            maxPoolSize=100,
+            minPoolSize=10,
+            waitQueueTimeoutMS=2500,
+            serverSelectionTimeoutMS=2000,
+            socketTimeoutMS=5000,
+            retryWrites=True,
+            w=1,
+            compressors="zlib"
+        )
+        _client._pid = os.getpid()
+    _ensure_indexes(_client)
+    return _client
+
+def get_db():
+    return get_client()[DB_NAME]  # Same database for all stores
+
+def pet_types_collection():
+    return get_db().pet_types
+
+def pets_collection():
+    return get_db().pets
+
+def ninja_cache():
+    return get_db().ninja_cache
+
+# How long cached Ninja API responses stay valid
+NINJA_CACHE_TTL = timedelta(days=7)
+
+# Create indexes matching the query shapes used by the handlers below, so the
+# find_one/find calls use index scans instead of scanning the whole collection.
+# Driven from get_client() rather than import time: if MongoDB isn't reachable
+# when a worker boots, creation is retried on the next request instead of the
+# unique constraints (which the duplicate checks rely on) silently never
+# existing for the life of the process.
+_indexes_ready = False
+
+def _ensure_indexes(client):
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    try:
+        db = client[DB_NAME]
+        db.pet_types.create_index([("store_id", 1), ("type", 1)], background=True)
+        # Unique so two concurrent POSTs of the same type can't both pass the
+        # check-then-insert window in post_pet_types; type_lc is the lowercase
+        # shadow, making the constraint case-insensitive like the dup check
+        db.pet_types.create_index(
+            [("store_id", 1), ("type_lc", 1)],
+            unique=True, background=True
+        )
+        db.pet_types.create_index([("store_id", 1), ("_id", 1)], background=True)
+        db.pets.create_index(
+            [("pet_type_id", 1), ("store_id", 1), ("name", 1)],
+            unique=True, background=True
+        )
+        db.pets.create_index(
+            [("pet_type_id", 1), ("store_id", 1), ("birthdate_iso", 1)],
+            background=True
+        )
+        db.ninja_cache.create_index("key", unique=True, background=True)
+        # TTL index so MongoDB eventually evicts expired cache entries itself
+        db.ninja_cache.create_index("expires_at", expireAfterSeconds=0, background=True)
+        _indexes_ready = True
+    except Exception:
+        pass
 
 
 # API configuration
 NINJA_API_KEY = os.getenv("NINJA_API_KEY", "UjA4kHG33oEofOpk4au2sg==Hm3gGGdRuu6njeG5")  # Use env var or fallback
 NINJA_API_URL = "https://api.api-ninjas.com/v1/animals"
 
+# Shared HTTP session so outbound calls (Ninja API, image downloads) reuse
+# pooled keep-alive connections instead of a fresh TCP+TLS handshake each time
+HTTP = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16, pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+HTTP.mount("http://", _adapter)
+HTTP.mount("https://", _adapter)
+
 # Image storage directory
 IMAGE_DIR = "images"
 if not os.path.exists(IMAGE_DIR):
     os.makedirs(IMAGE_DIR)
 
+# When running behind Nginx (see nginx.conf), set this to the internal
+# location that aliases IMAGE_DIR (e.g. "/_protected_images") so pictures
+# are served by Nginx via X-Accel-Redirect instead of through the Python
+# worker. Empty means serve the file from Flask directly.
+IMAGE_ACCEL_PREFIX = os.getenv("IMAGE_ACCEL_PREFIX", "")
+
+# Request body schemas, decoded and validated in one pass by msgspec
+# instead of hand-rolled isinstance checks on a parsed dict. Unknown
+# fields are ignored, matching the old behavior.
+class PetTypeCreate(msgspec.Struct):
+    type: str
+
+class PetBody(msgspec.Struct):
+    name: str
+    birthdate: str | None = None
+    # Some clients historically sent the birthdate under a typo'd key
+    birthdate_typo: str | None = msgspec.field(default=None, name="birthdate:")
+    picture_url: str | None = msgspec.field(default=None, name="picture-url")
+
+def parse_body(schema):
+    """Read and decode the request body against a schema, exactly once.
+
+    Returns (body, None) on success, or (None, error_response) where
+    error_response is ready to be returned from the handler. The raw bytes
+    are read with cache=False since nothing parses the body a second time.
+    """
+    if not request.is_json:
+        return None, (jsonify({"error": "Expected application/json media type"}), 415)
+    try:
+        return msgspec.json.decode(request.get_data(cache=False), type=schema), None
+    except msgspec.DecodeError:
+        return None, (jsonify({"error": "Malformed data"}), 400)
+
+# Handlers no longer wrap their bodies in a broad try/except; database
+# failures and any other unhandled error are translated here instead
+@app.errorhandler(PyMongoError)
+def handle_db_error(e):
+    return jsonify({"error": "Database error"}), 500
+
+@app.errorhandler(500)
+def handle_internal_error(e):
+    return jsonify({"error": "Database error"}), 500
+
 # Basic route to test that the server is running
 @app.route("/", methods=["GET"])
 def home():
     return jsonify({"message": "Pet Store API is running"}), 200
 
+# 24 hex chars - the only string form ObjectId accepts
+_HEX24_RE = re.compile(r'^[0-9a-fA-F]{24}$')
+
+def _oid(value):
+    """Convert an id string to ObjectId, or None if it can't be one.
+
+    The cheap regex check avoids constructing and unwinding an InvalidId
+    exception on every request with a malformed id (a common 404 path).
+    """
+    if value and _HEX24_RE.match(value):
+        return ObjectId(value)
+    return None
+
+def get_pet_names(pet_type_id):
+    """List the names of a pet-type's pets (covered by the pets name index)"""
+    return [doc["name"] for doc in pets_collection().find(
+        {"pet_type_id": pet_type_id, "store_id": STORE_ID},
+        {"_id": 0, "name": 1}
+    )]
+
 @app.route("/pet-types", methods=["GET"])
 def get_pet_types():
-    try:
-        # Build base query with store filter
-        mongo_query = {"store_id": STORE_ID}  # Keep as string to match what we store
-        
-        # Add filters from URL parameters
-        for key, value in request.args.items():
-            if key == "hasAttribute":
-                # Better: Use $elemMatch for case-insensitive array search
-                mongo_query["attributes"] = {
-                    "$elemMatch": {"$regex": f"^{value}$", "$options": "i"}
-                }
-            elif key == "id":
-                # Convert string ID to ObjectId for filtering
-                try:
-                    mongo_query["_id"] = ObjectId(value)
-                except:
-                    # Invalid ObjectId format - no results will match
-                    mongo_query["_id"] = None
-            elif key in ["type", "family", "genus"]:
-                # Case-insensitive exact matching
-                mongo_query[key] = {"$regex": f"^{value}$", "$options": "i"}
-            elif key == "lifespan":
-                # Handle both numeric and string lifespan
-                if value.isdigit():
-                    mongo_query[key] = int(value)
-                else:
-                    mongo_query[key] = {"$regex": f"^{value}$", "$options": "i"}
-        
-        # Query with field exclusion
-        pet_types = list(pet_types_collection.find(
-            mongo_query, 
-            {"store_id": 0}  # Only exclude store_id, keep _id for conversion
-        ))
-        
-        # Convert _id to id for each pet type
-        for pet_type in pet_types:
-            pet_type["id"] = str(pet_type["_id"])
-            pet_type.pop("_id")
-        
-        return jsonify(pet_types), 200
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+    # Build base query with store filter
+    mongo_query = {"store_id": STORE_ID}  # Keep as string to match what we store
+    
+    # Add filters from URL parameters. Case-insensitive matching uses the
+    # lowercased shadow fields written by post_pet_types (equality on an
+    # indexed field) instead of per-document $regex matching.
+    for key, value in request.args.items():
+        if key == "hasAttribute":
+            mongo_query["attributes_lc"] = value.lower()
+        elif key == "id":
+            # Invalid ObjectId format yields None - no results will match
+            mongo_query["_id"] = _oid(value)
+        elif key in ["type", "family", "genus"]:
+            # Case-insensitive exact matching on the lowercased field
+            mongo_query[key + "_lc"] = value.lower()
+        elif key == "lifespan":
+            # Handle both numeric and string lifespan
+            if value.isdigit():
+                mongo_query[key] = int(value)
+            else:
+                mongo_query[key] = {"$regex": f"^{re.escape(value)}$", "$options": "i"}
+    
+    # Allow callers to request only the fields they need (e.g.
+    # ?fields=id,type from the order service) so we don't serialize the
+    # full documents including the pets array on every lookup
+    # Exclude store_id and the lowercased shadow fields, keep _id for conversion
+    internal_fields = {"store_id", "type_lc", "family_lc",
+                       "genus_lc", "attributes_lc"}
+    projection = {field: 0 for field in internal_fields}
+    fields_param = request.args.get("fields")
+    if fields_param:
+        projection = {"_id": 1}
+        for field in fields_param.split(","):
+            field = field.strip()
+            # Internal names stay internal even when explicitly requested
+            if field and field != "id" and field not in internal_fields:
+                projection[field] = 1
+
+    pet_types = list(pet_types_collection().find(mongo_query, projection))
+
+    # Convert _id to id for each pet type and derive the pets list from
+    # the pets collection (it is no longer stored on the pet-type doc)
+    include_pets = not fields_param or "pets" in projection
+    for pet_type in pet_types:
+        pet_type["id"] = str(pet_type["_id"])
+        pet_type.pop("_id")
+        if include_pets:
+            pet_type["pets"] = get_pet_names(pet_type["id"])
+    
+    return jsonify(pet_types), 200
 
 def fetch_animal_info(animal_name):
-    """Fetch animal information from Ninja API"""
+    """Fetch animal information from Ninja API (cached in MongoDB)"""
     try:
-        headers = {
-            'X-Api-Key': NINJA_API_KEY
-        }
-        response = requests.get(f"{NINJA_API_URL}?name={animal_name}", headers=headers)
-        
-        if response.status_code == 200:
-            animals = response.json()
-            # Find exact match (case insensitive)
-            for animal in animals:
-                if animal.get('name', '').lower() == animal_name.lower():
-                    return animal
-            return None
+        # Check the cache first so repeated creates of the same type don't
+        # hit the Ninja API (and its rate limit) every time
+        cache_key = hashlib.sha1(f"animals:{animal_name.lower()}".encode()).hexdigest()
+        try:
+            cached = ninja_cache().find_one({"key": cache_key})
+        except Exception:
+            cached = None
+        if cached and cached.get("expires_at", datetime.min) > datetime.utcnow():
+            animals = cached["payload"]
         else:
-            return response.status_code
+            headers = {
+                'X-Api-Key': NINJA_API_KEY
+            }
+            response = HTTP.get(f"{NINJA_API_URL}?name={animal_name}", headers=headers)
+
+            if response.status_code != 200:
+                return response.status_code
+
+            animals = response.json()
+            try:
+                ninja_cache().update_one(
+                    {"key": cache_key},
+                    {"$set": {
+                        "payload": animals,
+                        "expires_at": datetime.utcnow() + NINJA_CACHE_TTL
+                    }},
+                    upsert=True
+                )
+            except Exception:
+                pass  # Caching is best-effort; the lookup already succeeded
+
+        # Find exact match (case insensitive; fold the target once rather
+        # than lowercasing both sides on every iteration)
+        target = animal_name.casefold()
+        for animal in animals:
+            if animal.get('name', '').casefold() == target:
+                return animal
+        return None
     except:
         return 500
 
+# Patterns used on every pet-type POST, compiled once at import
+_LIFESPAN_RE = re.compile(r'\d+')
+_WORD_RE = re.compile(r'\w+')
+
 def parse_lifespan(lifespan_str):
     """Parse lifespan string to get the minimum number"""
     if not lifespan_str:
         return None
-    
+
     # Extract all numbers from the string
-    numbers = re.findall(r'\d+', lifespan_str)
+    numbers = _LIFESPAN_RE.findall(lifespan_str)
     if numbers:
         return int(numbers[0])  # Return the first (lowest) number
     return None
@@ -117,144 +320,156 @@ def parse_attributes(animal_data):
     text = animal_data.get('characteristics', {}).get('temperament')
     if not text:
         text = animal_data.get('characteristics', {}).get('group_behavior')
-    
+
     if not text:
         return []
-    
+
     # Split into words and remove punctuation
-    words = re.findall(r'\w+', text)
+    words = _WORD_RE.findall(text)
     return words
 
 @app.route("/pet-types", methods=["POST"])
 def post_pet_types():
-    try:
-        # Check that the request is JSON
-        if not request.is_json:
-            return jsonify({"error": "Expected application/json media type"}), 415
+    body, error = parse_body(PetTypeCreate)
+    if error:
+        return error
 
-        # Try to read the JSON body
-        data = request.get_json(silent=True)
-        if data is None:
-            return jsonify({"error": "Malformed data"}), 400
-
-        # Validate that "type" exists and is a string
-        if "type" not in data or not isinstance(data["type"], str):
-            return jsonify({"error": "Malformed data"}), 400
+    animal_type = body.type.strip()
+    
+    # Check if this pet type already exists in this store (existence
+    # check only, so just pull _id). Case-insensitive equality on the
+    # lowercase shadow field hits the unique (store_id, type_lc) index —
+    # the same constraint that backs this check — whereas a collated
+    # comparison could not use the simple-collation indexes at all.
+    existing_type = pet_types_collection().find_one(
+        {"store_id": STORE_ID, "type_lc": animal_type.lower()},
+        {"_id": 1}
+    )
+    if existing_type:
+        return jsonify({"error": "Malformed data"}), 400
+
+    # Fetch animal info from Ninja API
+    result = fetch_animal_info(animal_type)
+
+    # Case 1: API error (401/403/500)
+    if isinstance(result, int) and result != 200:
+        return jsonify({"server error": f"API response code {result}"}), 500
+
+    # Case 2: type not found in Ninja → malformed data
+    if result is None:
+        return jsonify({"error": "Malformed data"}), 400
+
+    # Case 3: success
+    animal_info = result
+
+    # Extract information from Ninja API response
+    taxonomy = animal_info.get('taxonomy', {})
+    characteristics = animal_info.get('characteristics', {})
+    
+    family = taxonomy.get('family', '')
+    genus = taxonomy.get('genus', '')
+    attributes = parse_attributes(animal_info)
+    lifespan = parse_lifespan(characteristics.get('lifespan'))
+
+    # Build the pet-type object (no custom id needed). The *_lc shadow
+    # fields back the case-insensitive equality filters in get_pet_types.
+    pet_type_obj = {
+        "type": animal_type,
+        "family": family,
+        "genus": genus,
+        "attributes": attributes,
+        "lifespan": lifespan,
+        "store_id": STORE_ID,
+        "type_lc": animal_type.lower(),
+        "family_lc": family.lower(),
+        "genus_lc": genus.lower(),
+        "attributes_lc": [a.lower() for a in attributes]
+    }
+
+    # Save to MongoDB and get the inserted_id. The duplicate find_one above
+    # races against concurrent inserts (the Ninja lookup sits between check
+    # and insert), so the unique (store_id, type_lc) index is the real
+    # guard: a loser of the race gets the same 400 as the explicit check.
+    try:
+        result = pet_types_collection().insert_one(pet_type_obj)
+    except DuplicateKeyError:
+        return jsonify({"error": "Malformed data"}), 400
+    
+    # Use MongoDB's _id as our id
+    pet_type_obj["id"] = str(result.inserted_id)
+    pet_type_obj["pets"] = []  # Derived field; a new type has no pets yet
+    pet_type_obj.pop('_id', None)
+    pet_type_obj.pop('store_id', None)
+    for lc_field in ('type_lc', 'family_lc', 'genus_lc', 'attributes_lc'):
+        pet_type_obj.pop(lc_field, None)
+    return jsonify(pet_type_obj), 201
 
-        animal_type = data["type"].strip()
-        
-        # Check if this pet type already exists in this store
-        existing_type = pet_types_collection.find_one({
-            "store_id": STORE_ID,
-            "type": {"$regex": f"^{animal_type}$", "$options": "i"}
-        })
-        if existing_type:
-            return jsonify({"error": "Malformed data"}), 400
+@app.route("/pet-types/<pet_type_id>", methods=["GET"])
+def get_pet_type(pet_type_id):
+    # Validate and convert string ID to ObjectId
+    object_id = _oid(pet_type_id)
+    if object_id is None:
+        return jsonify({"error": "Not found"}), 404
 
-        # Fetch animal info from Ninja API
-        result = fetch_animal_info(animal_type)
+    pet_type = pet_types_collection().find_one(
+        {"_id": object_id, "store_id": STORE_ID},
+        {"type_lc": 0, "family_lc": 0, "genus_lc": 0, "attributes_lc": 0}
+    )
+    if not pet_type:
+        return jsonify({"error": "Not found"}), 404
 
-        # Case 1: API error (401/403/500)
-        if isinstance(result, int) and result != 200:
-            return jsonify({"server error": f"API response code {result}"}), 500
+    # Convert _id to string id for response
+    pet_type["id"] = str(pet_type["_id"])
+    pet_type.pop("_id")
+    pet_type.pop("store_id")
+    pet_type["pets"] = get_pet_names(pet_type["id"])
+    
+    return jsonify(pet_type), 200
 
-        # Case 2: type not found in Ninja → malformed data
-        if result is None:
-            return jsonify({"error": "Malformed data"}), 400
+@app.route("/pet-types/<pet_type_id>", methods=["DELETE"])
+def delete_pet_type(pet_type_id):
+    # Validate and convert string ID to ObjectId
+    object_id = _oid(pet_type_id)
+    if object_id is None:
+        return jsonify({"error": "Not found"}), 404
 
-        # Case 3: success
-        animal_info = result
+    pet_type = pet_types_collection().find_one({"_id": object_id, "store_id": STORE_ID}, {"_id": 1})
+    if not pet_type:
+        return jsonify({"error": "Not found"}), 404
 
-        # Extract information from Ninja API response
-        taxonomy = animal_info.get('taxonomy', {})
-        characteristics = animal_info.get('characteristics', {})
-        
-        family = taxonomy.get('family', '')
-        genus = taxonomy.get('genus', '')
-        attributes = parse_attributes(animal_info)
-        lifespan = parse_lifespan(characteristics.get('lifespan'))
-
-        # Build the pet-type object (no custom id needed)
-        pet_type_obj = {
-            "type": animal_type,
-            "family": family,
-            "genus": genus,
-            "attributes": attributes,
-            "lifespan": lifespan,
-            "pets": [],
-            "store_id": STORE_ID
-        }
+    # Check if pet-type has pets
+    if pets_collection().find_one(
+        {"pet_type_id": pet_type_id, "store_id": STORE_ID}, {"_id": 1}
+    ):
+        return jsonify({"error": "Malformed data"}), 400
+    
+    # Delete the pet-type and all its pets
+    pet_types_collection().delete_one({"_id": object_id, "store_id": STORE_ID})
+    pets_collection().delete_many({"pet_type_id": pet_type_id, "store_id": STORE_ID})
+    
+    return "", 204
 
-        # Save to MongoDB and get the inserted_id
-        result = pet_types_collection.insert_one(pet_type_obj)
-        
-        # Use MongoDB's _id as our id
-        pet_type_obj["id"] = str(result.inserted_id)
-        pet_type_obj.pop('_id', None)
-        pet_type_obj.pop('store_id', None)
-        return jsonify(pet_type_obj), 201
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+# Refuse image downloads larger than this before streaming them
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
 
-@app.route("/pet-types/<pet_type_id>", methods=["GET"])
-def get_pet_type(pet_type_id):
+def download_image(url, filename):
+    """Download image from URL and stream it to a local file"""
     try:
-        # Convert string ID to ObjectId
-        try:
-            object_id = ObjectId(pet_type_id)
-        except:
-            return jsonify({"error": "Not found"}), 404
-            
-        pet_type = pet_types_collection.find_one(
-            {"_id": object_id, "store_id": STORE_ID}
-        )
-        if not pet_type:
-            return jsonify({"error": "Not found"}), 404
-        
-        # Convert _id to string id for response
-        pet_type["id"] = str(pet_type["_id"])
-        pet_type.pop("_id")
-        pet_type.pop("store_id")
-        
-        return jsonify(pet_type), 200
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+        # stream=True writes the body to disk chunk by chunk instead of
+        # buffering the whole image in memory first
+        with HTTP.get(url, stream=True, timeout=(3, 10)) as response:
+            if response.status_code != 200:
+                return False
 
-@app.route("/pet-types/<pet_type_id>", methods=["DELETE"])
-def delete_pet_type(pet_type_id):
-    try:
-        # Convert string ID to ObjectId
-        try:
-            object_id = ObjectId(pet_type_id)
-        except:
-            return jsonify({"error": "Not found"}), 404
-            
-        pet_type = pet_types_collection.find_one({"_id": object_id, "store_id": STORE_ID})
-        if not pet_type:
-            return jsonify({"error": "Not found"}), 404
-        
-        # Check if pet-type has pets
-        if pet_type["pets"]:
-            return jsonify({"error": "Malformed data"}), 400
-        
-        # Delete the pet-type and all its pets
-        pet_types_collection.delete_one({"_id": object_id, "store_id": STORE_ID})
-        pets_collection.delete_many({"pet_type_id": pet_type_id, "store_id": STORE_ID})
-        
-        return "", 204
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+            content_length = response.headers.get("Content-Length")
+            if content_length and int(content_length) > MAX_IMAGE_BYTES:
+                return False
 
-def download_image(url, filename):
-    """Download image from URL and save to local file"""
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
             filepath = os.path.join(IMAGE_DIR, filename)
             with open(filepath, 'wb') as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
             return True
-        return False
     except:
         return False
 
@@ -267,322 +482,286 @@ def parse_date_range(date_str):
 
 @app.route("/pet-types/<pet_type_id>/pets", methods=["GET"])
 def get_pets(pet_type_id):
-    try:
-        # Convert string ID to ObjectId
-        try:
-            object_id = ObjectId(pet_type_id)
-        except:
-            return jsonify({"error": "Not found"}), 404
-            
-        pet_type = pet_types_collection.find_one({"_id": object_id, "store_id": STORE_ID})
-        if not pet_type:
-            return jsonify({"error": "Not found"}), 404
-        
-        # Build MongoDB query with store and pet type filters
-        mongo_query = {"pet_type_id": pet_type_id, "store_id": STORE_ID}
-        
-        # Handle query parameters for date filtering
-        birth_date_gt = request.args.get('birthdateGT')
-        birth_date_lt = request.args.get('birthdateLT')
-        
-        # For date filtering, we need to fetch and filter in Python since 
-        # birthdates are stored as strings in "dd-mm-yyyy" format
-        # and MongoDB string comparison won't work for date ranges
-        filter_dates = birth_date_gt or birth_date_lt
-        
-        pets = list(pets_collection.find(
-            mongo_query, 
-            {"_id": 0, "pet_type_id": 0, "store_id": 0}
-        ))
-        
-        # Apply date filtering in Python if needed
-        if filter_dates:
-            filtered_pets = []
-            for pet in pets:
-                if pet['birthdate'] == 'NA':
-                    continue
-                
-                pet_date = parse_date_range(pet['birthdate'])
-                if not pet_date:
-                    continue
-                
-                include_pet = True
-                
-                if birth_date_gt:
-                    gt_date = parse_date_range(birth_date_gt)
-                    if gt_date and pet_date <= gt_date:
-                        include_pet = False
-                
-                if birth_date_lt:
-                    lt_date = parse_date_range(birth_date_lt)
-                    if lt_date and pet_date >= lt_date:
-                        include_pet = False
-                
-                if include_pet:
-                    filtered_pets.append(pet)
-            
-            pets = filtered_pets
-        
-        return jsonify(pets), 200
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+    # Validate and convert string ID to ObjectId
+    object_id = _oid(pet_type_id)
+    if object_id is None:
+        return jsonify({"error": "Not found"}), 404
+
+    pet_type = pet_types_collection().find_one({"_id": object_id, "store_id": STORE_ID}, {"_id": 1})
+    if not pet_type:
+        return jsonify({"error": "Not found"}), 404
+    
+    # Build MongoDB query with store and pet type filters
+    mongo_query = {"pet_type_id": pet_type_id, "store_id": STORE_ID}
+    
+    # Handle query parameters for date filtering. Birthdates are stored
+    # twice: the original "dd-mm-yyyy" string for responses, and a real
+    # datetime in birthdate_iso so MongoDB can do the range match itself
+    # (pets with no/unparsable birthdate have no birthdate_iso field and
+    # are excluded by the range match, same as the old Python filter).
+    birth_date_gt = request.args.get('birthdateGT')
+    birth_date_lt = request.args.get('birthdateLT')
+
+    date_range = {}
+    if birth_date_gt:
+        gt_date = parse_date_range(birth_date_gt)
+        if gt_date:
+            date_range["$gt"] = gt_date
+    if birth_date_lt:
+        lt_date = parse_date_range(birth_date_lt)
+        if lt_date:
+            date_range["$lt"] = lt_date
+    if date_range or birth_date_gt or birth_date_lt:
+        mongo_query["birthdate_iso"] = date_range if date_range else {"$exists": True}
+
+    pets = list(pets_collection().find(
+        mongo_query,
+        {"_id": 0, "pet_type_id": 0, "store_id": 0, "birthdate_iso": 0}
+    ))
+
+    return jsonify(pets), 200
 
 @app.route("/pet-types/<pet_type_id>/pets", methods=["POST"])
 def post_pet(pet_type_id):
-    try:
-        # Convert string ID to ObjectId
-        try:
-            object_id = ObjectId(pet_type_id)
-        except:
-            return jsonify({"error": "Not found"}), 404
-            
-        pet_type = pet_types_collection.find_one({"_id": object_id, "store_id": STORE_ID})
-        if not pet_type:
-            return jsonify({"error": "Not found"}), 404
-        
-        if not request.is_json:
-            return jsonify({"error": "Expected application/json media type"}), 415
-
-        data = request.get_json(silent=True)
-        if data is None:
-            return jsonify({"error": "Malformed data"}), 400
-
-        # Validate required name field
-        if "name" not in data or not isinstance(data["name"], str):
-            return jsonify({"error": "Malformed data"}), 400
-
-        pet_name = data["name"].strip()
-        
-        # Check if pet with this name already exists for this type in this store
-        existing_pet = pets_collection.find_one({
-            "pet_type_id": pet_type_id, 
-            "name": pet_name,
-            "store_id": STORE_ID
-        })
-        if existing_pet:
-            return jsonify({"error": "Malformed data"}), 400
-
-        # Handle optional fields
-        birthdate = data.get("birthdate")
-        if birthdate is None:
-            birthdate = data.get("birthdate:")
-        if birthdate is None:
-            birthdate = "NA"
-
-        picture_url = data.get('picture-url')
-        picture_filename = 'NA'
-        
-        # Download image if URL provided
-        if picture_url and picture_url.strip():
-            # Generate unique filename
-            parsed_url = urlparse(picture_url)
-            ext = os.path.splitext(parsed_url.path)[1].lower()
-
-            # Convert .jpeg → .jpg and enforce only .jpg/.png for schema compliance
-            if ext == ".jpeg":
-                ext = ".jpg"
-            if ext not in [".jpg", ".png"]:
-                ext = ".jpg"
-            picture_filename = f"{pet_name}-{pet_type['type'].replace(' ', '')}{ext}"
-            
-            if download_image(picture_url, picture_filename):
-                pass  # Successfully downloaded
-            else:
-                picture_filename = 'NA'
-
-        # Create pet object
-        pet_obj = {
-            "name": pet_name,
-            "birthdate": birthdate,
-            "picture": picture_filename,
-            "pet_type_id": pet_type_id,
-            "store_id": STORE_ID
-        }
+    # Validate and convert string ID to ObjectId
+    object_id = _oid(pet_type_id)
+    if object_id is None:
+        return jsonify({"error": "Not found"}), 404
 
-        # Save to MongoDB
-        pets_collection.insert_one(pet_obj)
-        
-        # Update pet-type's pets list
-        pet_types_collection.update_one(
-            {"_id": object_id, "store_id": STORE_ID},
-            {"$push": {"pets": pet_name}}
-        )
+    pet_type = pet_types_collection().find_one({"_id": object_id, "store_id": STORE_ID}, {"type": 1})
+    if not pet_type:
+        return jsonify({"error": "Not found"}), 404
+    
+    body, error = parse_body(PetBody)
+    if error:
+        return error
+
+    pet_name = body.name.strip()
+
+    # Check if pet with this name already exists for this type in this store
+    existing_pet = pets_collection().find_one({
+        "pet_type_id": pet_type_id,
+        "name": pet_name,
+        "store_id": STORE_ID
+    }, {"_id": 1})
+    if existing_pet:
+        return jsonify({"error": "Malformed data"}), 400
+
+    # Handle optional fields
+    birthdate = body.birthdate
+    if birthdate is None:
+        birthdate = body.birthdate_typo
+    if birthdate is None:
+        birthdate = "NA"
+
+    picture_url = body.picture_url
+    picture_filename = 'NA'
+    
+    # Download image if URL provided
+    if picture_url and picture_url.strip():
+        # Generate unique filename
+        parsed_url = urlparse(picture_url)
+        ext = os.path.splitext(parsed_url.path)[1].lower()
+
+        # Convert .jpeg → .jpg and enforce only .jpg/.png for schema compliance
+        if ext == ".jpeg":
+            ext = ".jpg"
+        if ext not in [".jpg", ".png"]:
+            ext = ".jpg"
+        picture_filename = f"{pet_name}-{pet_type['type'].replace(' ', '')}{ext}"
+        
+        if download_image(picture_url, picture_filename):
+            pass  # Successfully downloaded
+        else:
+            picture_filename = 'NA'
+
+    # Create pet object
+    pet_obj = {
+        "name": pet_name,
+        "birthdate": birthdate,
+        "picture": picture_filename,
+        "pet_type_id": pet_type_id,
+        "store_id": STORE_ID
+    }
+
+    # Also store the birthdate as a real datetime so date range
+    # queries can be answered by MongoDB (see get_pets)
+    if birthdate != "NA":
+        birthdate_iso = parse_date_range(birthdate)
+        if birthdate_iso:
+            pet_obj["birthdate_iso"] = birthdate_iso
+
+    # Save to MongoDB (the pet-type's pets list is derived on read, so
+    # there is no second update to keep in sync). The duplicate check above
+    # races across the image download, so the unique pets index is the real
+    # guard: a race loser gets the duplicate 400, same as the explicit check.
+    try:
+        pets_collection().insert_one(pet_obj)
+    except DuplicateKeyError:
+        return jsonify({"error": "Malformed data"}), 400
 
-        # Remove MongoDB fields and return
-        pet_obj.pop('_id', None)
-        pet_obj.pop('pet_type_id', None)
-        pet_obj.pop('store_id', None)
-        return jsonify(pet_obj), 201
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+    # Remove MongoDB fields and return
+    pet_obj.pop('_id', None)
+    pet_obj.pop('pet_type_id', None)
+    pet_obj.pop('store_id', None)
+    pet_obj.pop('birthdate_iso', None)
+    return jsonify(pet_obj), 201
 
 @app.route("/pet-types/<pet_type_id>/pets/<pet_name>", methods=["GET"])
 def get_pet(pet_type_id, pet_name):
-    try:
-        # Convert string ID to ObjectId
-        try:
-            object_id = ObjectId(pet_type_id)
-        except:
-            return jsonify({"error": "Not found"}), 404
-            
-        pet_type = pet_types_collection.find_one({"_id": object_id, "store_id": STORE_ID})
-        if not pet_type:
-            return jsonify({"error": "Not found"}), 404
-        
-        pet = pets_collection.find_one(
-            {"pet_type_id": pet_type_id, "name": pet_name, "store_id": STORE_ID}, 
-            {"_id": 0, "pet_type_id": 0, "store_id": 0}
-        )
-        if not pet:
-            return jsonify({"error": "Not found"}), 404
-        
-        return jsonify(pet), 200
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+    # Validate and convert string ID to ObjectId
+    object_id = _oid(pet_type_id)
+    if object_id is None:
+        return jsonify({"error": "Not found"}), 404
+
+    pet_type = pet_types_collection().find_one({"_id": object_id, "store_id": STORE_ID}, {"_id": 1})
+    if not pet_type:
+        return jsonify({"error": "Not found"}), 404
+    
+    pet = pets_collection().find_one(
+        {"pet_type_id": pet_type_id, "name": pet_name, "store_id": STORE_ID},
+        {"_id": 0, "pet_type_id": 0, "store_id": 0, "birthdate_iso": 0}
+    )
+    if not pet:
+        return jsonify({"error": "Not found"}), 404
+    
+    return jsonify(pet), 200
 
 @app.route("/pet-types/<pet_type_id>/pets/<pet_name>", methods=["DELETE"])
 def delete_pet(pet_type_id, pet_name):
-    try:
-        # Convert string ID to ObjectId
-        try:
-            object_id = ObjectId(pet_type_id)
-        except:
-            return jsonify({"error": "Not found"}), 404
-            
-        pet_type = pet_types_collection.find_one({"_id": object_id, "store_id": STORE_ID})
-        if not pet_type:
-            return jsonify({"error": "Not found"}), 404
-        
-        pet = pets_collection.find_one({
-            "pet_type_id": pet_type_id, 
-            "name": pet_name,
-            "store_id": STORE_ID
-        })
-        if not pet:
-            return jsonify({"error": "Not found"}), 404
-        
-        # Delete associated image file if it exists
-        if pet["picture"] != "NA":
-            image_path = os.path.join(IMAGE_DIR, pet["picture"])
-            if os.path.exists(image_path):
-                os.remove(image_path)
-        
-        # Remove from MongoDB
-        pets_collection.delete_one({
-            "pet_type_id": pet_type_id, 
-            "name": pet_name,
-            "store_id": STORE_ID
-        })
-        
-        # Remove from pet-type's pets list
-        pet_types_collection.update_one(
-            {"_id": object_id, "store_id": STORE_ID},
-            {"$pull": {"pets": pet_name}}
-        )
-        
-        return "", 204
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+    # Validate and convert string ID to ObjectId
+    object_id = _oid(pet_type_id)
+    if object_id is None:
+        return jsonify({"error": "Not found"}), 404
+
+    pet_type = pet_types_collection().find_one({"_id": object_id, "store_id": STORE_ID}, {"_id": 1})
+    if not pet_type:
+        return jsonify({"error": "Not found"}), 404
+    
+    pet = pets_collection().find_one({
+        "pet_type_id": pet_type_id,
+        "name": pet_name,
+        "store_id": STORE_ID
+    }, {"picture": 1})
+    if not pet:
+        return jsonify({"error": "Not found"}), 404
+    
+    # Delete associated image file if it exists
+    if pet["picture"] != "NA":
+        image_path = os.path.join(IMAGE_DIR, pet["picture"])
+        if os.path.exists(image_path):
+            os.remove(image_path)
+    
+    # Remove from MongoDB (the pet-type's pets list is derived on read)
+    pets_collection().delete_one({
+        "pet_type_id": pet_type_id,
+        "name": pet_name,
+        "store_id": STORE_ID
+    })
+
+    return "", 204
 
 @app.route("/pet-types/<pet_type_id>/pets/<pet_name>", methods=["PUT"])
 def put_pet(pet_type_id, pet_name):
-    try:
-        # Convert string ID to ObjectId
-        try:
-            object_id = ObjectId(pet_type_id)
-        except:
-            return jsonify({"error": "Not found"}), 404
-            
-        pet_type = pet_types_collection.find_one({"_id": object_id, "store_id": STORE_ID})
-        if not pet_type:
-            return jsonify({"error": "Not found"}), 404
-        
-        current_pet = pets_collection.find_one({
-            "pet_type_id": pet_type_id, 
-            "name": pet_name,
-            "store_id": STORE_ID
-        })
-        if not current_pet:
-            return jsonify({"error": "Not found"}), 404
-        
-        if not request.is_json:
-            return jsonify({"error": "Expected application/json media type"}), 415
+    # Validate and convert string ID to ObjectId
+    object_id = _oid(pet_type_id)
+    if object_id is None:
+        return jsonify({"error": "Not found"}), 404
 
-        data = request.get_json(silent=True)
-        if data is None:
-            return jsonify({"error": "Malformed data"}), 400
+    pet_type = pet_types_collection().find_one({"_id": object_id, "store_id": STORE_ID}, {"type": 1})
+    if not pet_type:
+        return jsonify({"error": "Not found"}), 404
+    
+    current_pet = pets_collection().find_one({
+        "pet_type_id": pet_type_id,
+        "name": pet_name,
+        "store_id": STORE_ID
+    }, {"birthdate": 1, "picture": 1})
+    if not current_pet:
+        return jsonify({"error": "Not found"}), 404
+    
+    body, error = parse_body(PetBody)
+    if error:
+        return error
 
-        # Validate required name field
-        if "name" not in data or not isinstance(data["name"], str):
+    new_name = body.name.strip()
+
+    # If name is changing, check it doesn't conflict
+    if new_name != pet_name:
+        existing_pet = pets_collection().find_one({
+            "pet_type_id": pet_type_id,
+            "name": new_name,
+            "store_id": STORE_ID
+        }, {"_id": 1})
+        if existing_pet:
             return jsonify({"error": "Malformed data"}), 400
 
-        new_name = data["name"].strip()
-        
-        # If name is changing, check it doesn't conflict
-        if new_name != pet_name:
-            existing_pet = pets_collection.find_one({
-                "pet_type_id": pet_type_id, 
-                "name": new_name,
-                "store_id": STORE_ID
-            })
-            if existing_pet:
-                return jsonify({"error": "Malformed data"}), 400
-        
-        # Handle optional fields
-        birthdate = data.get('birthdate', current_pet['birthdate'])
-        picture_url = data.get('picture-url')
-        picture_filename = current_pet['picture']
-        
-        # Handle image update
-        if picture_url and picture_url.strip():
-            parsed_url = urlparse(picture_url)
-            ext = os.path.splitext(parsed_url.path)[1] or '.jpg'
-            new_picture_filename = f"{new_name}-{pet_type['type'].replace(' ', '')}{ext}"
-            
-            if download_image(picture_url, new_picture_filename):
-                # Delete old image if it exists and is different
-                if picture_filename != "NA" and picture_filename != new_picture_filename:
-                    old_path = os.path.join(IMAGE_DIR, picture_filename)
-                    if os.path.exists(old_path):
-                        os.remove(old_path)
-                picture_filename = new_picture_filename
-
-        # Update pet in MongoDB
-        pets_collection.update_one(
+    # Handle optional fields (absent birthdate keeps the current one)
+    birthdate = body.birthdate if body.birthdate is not None else current_pet['birthdate']
+    picture_url = body.picture_url
+    picture_filename = current_pet['picture']
+    
+    # Handle image update
+    if picture_url and picture_url.strip():
+        parsed_url = urlparse(picture_url)
+        ext = os.path.splitext(parsed_url.path)[1] or '.jpg'
+        new_picture_filename = f"{new_name}-{pet_type['type'].replace(' ', '')}{ext}"
+        
+        if download_image(picture_url, new_picture_filename):
+            # Delete old image if it exists and is different
+            if picture_filename != "NA" and picture_filename != new_picture_filename:
+                old_path = os.path.join(IMAGE_DIR, picture_filename)
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+            picture_filename = new_picture_filename
+
+    # Update pet in MongoDB (keep birthdate_iso in sync for date queries)
+    update_doc = {"$set": {
+        "name": new_name,
+        "birthdate": birthdate,
+        "picture": picture_filename
+    }}
+    birthdate_iso = parse_date_range(birthdate) if birthdate != "NA" else None
+    if birthdate_iso:
+        update_doc["$set"]["birthdate_iso"] = birthdate_iso
+    else:
+        update_doc["$unset"] = {"birthdate_iso": ""}
+    # The rename-conflict check above races against concurrent writes, so
+    # the unique pets index backs it: a losing rename gets the same 400
+    try:
+        pets_collection().update_one(
             {"pet_type_id": pet_type_id, "name": pet_name, "store_id": STORE_ID},
-            {"$set": {
-                "name": new_name,
-                "birthdate": birthdate,
-                "picture": picture_filename
-            }}
+            update_doc
         )
-        
-        # Update pet-type's pets list if name changed
-        if new_name != pet_name:
-            pet_types_collection.update_one(
-                {"_id": object_id, "store_id": STORE_ID},
-                {"$pull": {"pets": pet_name}}
-            )
-            pet_types_collection.update_one(
-                {"_id": object_id, "store_id": STORE_ID},
-                {"$push": {"pets": new_name}}
-            )
-
-        # Create response object
-        updated_pet = {
-            "name": new_name,
-            "birthdate": birthdate,
-            "picture": picture_filename
-        }
+    except DuplicateKeyError:
+        return jsonify({"error": "Malformed data"}), 400
+    
+    # Create response object
+    updated_pet = {
+        "name": new_name,
+        "birthdate": birthdate,
+        "picture": picture_filename
+    }
 
-        return jsonify(updated_pet), 200
-    except Exception as e:
-        return jsonify({"error": "Database error"}), 500
+    return jsonify(updated_pet), 200
 
 @app.route('/kill', methods=['GET'])
 def kill_container():
+    # Under gunicorn, exiting here would only take down this one worker and
+    # the master would respawn it; terminate the master so the whole
+    # container stops, like exiting did under the standalone dev server.
+    if os.getenv("SERVER_SOFTWARE", "").startswith("gunicorn"):
+        os.kill(os.getppid(), signal.SIGTERM)
     os._exit(1)
 
+# Extension -> MIME type for the picture endpoint (image/jpeg, not the
+# non-standard image/jpg previously returned)
+_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+
 @app.route("/pictures/<filename>", methods=["GET"])
 def get_picture(filename):
     file_path = os.path.join(IMAGE_DIR, filename)
@@ -591,16 +770,21 @@ def get_picture(filename):
         return jsonify({"error": "Not found"}), 404
     
     # Determine MIME type based on file extension
-    _, ext = os.path.splitext(filename)
-    if ext.lower() in ['.jpg', '.jpeg']:
-        mimetype = 'image/jpg'
-    elif ext.lower() == '.png':
-        mimetype = 'image/png'
-    else:
-        mimetype = 'application/octet-stream'
-    
+    mimetype = _MIME_TYPES.get(
+        os.path.splitext(filename)[1].lower(), 'application/octet-stream'
+    )
+
+    # Hand the transfer off to Nginx when configured: the worker returns
+    # after writing headers instead of pushing the file bytes itself
+    if IMAGE_ACCEL_PREFIX:
+        response = app.make_response(("", 200))
+        response.headers["X-Accel-Redirect"] = f"{IMAGE_ACCEL_PREFIX}/{filename}"
+        response.headers["Content-Type"] = mimetype
+        return response
+
     return send_file(file_path, mimetype=mimetype)
 
-# Entry point for running the Flask server
+# Dev-only entry point. In the container the app runs under gunicorn with
+# gevent workers (see gunicorn.conf.py): gunicorn -c gunicorn.conf.py app:app
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5001)
\ No newline at end of file
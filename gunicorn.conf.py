@@ -0,0 +1,15 @@
+import os
+
+# Shared gunicorn config for both services; the port comes from the
+# environment (5001/5002 for the pet stores, 5003 for the order service).
+# gevent workers monkey-patch socket ops, so the outbound Ninja API /
+# pet-store / MongoDB calls yield instead of blocking the whole worker.
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "gevent"
+worker_connections = 1000
+keepalive = 30
+
+# Keep preload off so every forked worker builds its own MongoClient
+# (see get_client in app.py / pet_order_service.py)
+preload_app = False
@@ -1,23 +1,112 @@
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
+import msgspec
+import orjson
 import requests
 import os
+import signal
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo.errors import ConnectionFailure, PyMongoError
 import random
 
 app = Flask(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which serializes much faster than
+    the stdlib json used by Flask's default provider"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonProvider(app)
+
+# Shared HTTP session so calls to the pet stores reuse pooled keep-alive
+# connections instead of a fresh TCP handshake per request
+HTTP = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16, pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+HTTP.mount("http://", _adapter)
+HTTP.mount("https://", _adapter)
+
+# Thread pool for fanning out lookups to both stores at once
+pool = ThreadPoolExecutor(max_workers=8)
+
 # MongoDB connection
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://mongodb:27017/")
-client = MongoClient(MONGO_URI)
-db = client.transactions
-transactions_collection = db.transactions
+
+# The MongoClient is created lazily and per-process: if the app is preloaded
+# by gunicorn and then forked into workers, each worker builds its own client
+# (with its own socket pool and monitor threads) instead of inheriting the
+# parent's, which PyMongo does not support.
+_client = None
+
+def get_client():
+    """Return a MongoClient owned by the current process"""
+    global _client
+    if _client is None or getattr(_client, "_pid", None) != os.getpid():
+        # Bound the connection pool explicitly and fail fast when MongoDB is
+        # unreachable instead of hanging on the 30s driver defaults.
+        _client = MongoClient(
+            MONGO_URI,
+            maxPoolSize=100,
+            minPoolSize=10,
+            waitQueueTimeoutMS=2500,
+            serverSelectionTimeoutMS=2000,
+            socketTimeoutMS=5000,
+            retryWrites=True,
+            w=1,
+            compressors="zlib"
+        )
+        _client._pid = os.getpid()
+    return _client
+
+def transactions_collection():
+    return get_client().transactions.transactions
 
 # Pet store service URLs
 PET_STORE_1_URL = os.getenv("PET_STORE_1_URL", "http://pet-store1:5001")
 PET_STORE_2_URL = os.getenv("PET_STORE_2_URL", "http://pet-store2:5001")
 
+# Purchase request schema, decoded and validated in one pass by msgspec
+# instead of hand-rolled isinstance checks on a parsed dict
+class PurchaseBody(msgspec.Struct):
+    purchaser: str
+    pet_type: str = msgspec.field(name="pet-type")
+    store: int | None = None
+    pet_name: str | None = msgspec.field(default=None, name="pet-name")
+
+def parse_body(schema):
+    """Read and decode the request body against a schema, exactly once.
+
+    Returns (body, None) on success, or (None, error_response) where
+    error_response is ready to be returned from the handler. The raw bytes
+    are read with cache=False since nothing parses the body a second time.
+    """
+    if not request.is_json:
+        return None, (jsonify({"error": "Expected application/json media type"}), 415)
+    try:
+        return msgspec.json.decode(request.get_data(cache=False), type=schema), None
+    except msgspec.DecodeError:
+        return None, (jsonify({"error": "Malformed data"}), 400)
+
+# Handlers no longer wrap their bodies in a broad try/except; database
+# failures and any other unhandled error are translated here instead
+@app.errorhandler(PyMongoError)
+def handle_db_error(e):
+    return jsonify({"error": "Server error"}), 500
+
+@app.errorhandler(500)
+def handle_internal_error(e):
+    return jsonify({"error": "Server error"}), 500
+
 @app.route("/", methods=["GET"])
 def home():
     return jsonify({"message": "Pet Order API is running"}), 200
@@ -25,11 +114,18 @@ def home():
 def get_pet_type_id(pet_type_name, store_url):
     """Get pet type ID from a pet store by name"""
     try:
-        response = requests.get(f"{store_url}/pet-types")
+        # Filter by type on the store side and only ask for id/type so the
+        # store doesn't serialize every pet-type document just to resolve a name
+        response = HTTP.get(
+            f"{store_url}/pet-types",
+            params={"type": pet_type_name, "fields": "id,type"}
+        )
         if response.status_code == 200:
-            pet_types = response.json()
-            for pet_type in pet_types:
-                if pet_type["type"].lower() == pet_type_name.lower():
+            # The store already filtered by type, so this usually sees zero
+            # or one entries; fold the target once for the comparison
+            target = pet_type_name.casefold()
+            for pet_type in response.json():
+                if pet_type["type"].casefold() == target:
                     return pet_type["id"]
         return None
     except:
@@ -38,7 +134,7 @@ def get_pet_type_id(pet_type_name, store_url):
 def get_pets_of_type(pet_type_id, store_url):
     """Get all pets of a specific type from a store"""
     try:
-        response = requests.get(f"{store_url}/pet-types/{pet_type_id}/pets")
+        response = HTTP.get(f"{store_url}/pet-types/{pet_type_id}/pets")
         if response.status_code == 200:
             return response.json()
         return []
@@ -48,7 +144,7 @@ def get_pets_of_type(pet_type_id, store_url):
 def delete_pet_from_store(pet_type_id, pet_name, store_url):
     """Delete a pet from a store"""
     try:
-        response = requests.delete(f"{store_url}/pet-types/{pet_type_id}/pets/{pet_name}")
+        response = HTTP.delete(f"{store_url}/pet-types/{pet_type_id}/pets/{pet_name}")
         return response.status_code == 204
     except:
         return False
@@ -90,127 +186,124 @@ def find_available_pet(pet_type, store=None, pet_name=None):
         return None
     
     else:
-        # Case 3: any store, any pet
+        # Case 3: any store, any pet - probe both stores concurrently so the
+        # latency is that of the slowest store, not the sum of both
         available_pets = []
-        
-        for store_id, store_url in store_urls.items():
-            pet_type_id = get_pet_type_id(pet_type, store_url)
-            if pet_type_id:
-                pets = get_pets_of_type(pet_type_id, store_url)
-                for pet in pets:
-                    available_pets.append({
-                        "pet": pet, 
-                        "store": store_id, 
-                        "pet_type_id": pet_type_id, 
-                        "store_url": store_url
-                    })
-        
+
+        type_ids = list(pool.map(
+            lambda item: (item[0], item[1], get_pet_type_id(pet_type, item[1])),
+            store_urls.items()
+        ))
+        found = [(store_id, store_url, pet_type_id)
+                 for store_id, store_url, pet_type_id in type_ids if pet_type_id]
+
+        pet_lists = list(pool.map(
+            lambda item: get_pets_of_type(item[2], item[1]),
+            found
+        ))
+        for (store_id, store_url, pet_type_id), pets in zip(found, pet_lists):
+            for pet in pets:
+                available_pets.append({
+                    "pet": pet,
+                    "store": store_id,
+                    "pet_type_id": pet_type_id,
+                    "store_url": store_url
+                })
+
         if available_pets:
             return random.choice(available_pets)
         return None
 
 @app.route("/purchases", methods=["POST"])
 def post_purchase():
-    try:
-        if not request.is_json:
-            return jsonify({"error": "Expected application/json media type"}), 415
-
-        data = request.get_json(silent=True)
-        if data is None:
-            return jsonify({"error": "Malformed data"}), 400
-
-        # Validate required fields
-        if "purchaser" not in data or not isinstance(data["purchaser"], str):
-            return jsonify({"error": "Malformed data"}), 400
-        if "pet-type" not in data or not isinstance(data["pet-type"], str):
-            return jsonify({"error": "Malformed data"}), 400
-
-        purchaser = data["purchaser"].strip()
-        pet_type = data["pet-type"].strip()
-        store = data.get("store")
-        pet_name = data.get("pet-name")
-
-        if store is not None and not isinstance(store, int):
-            return jsonify({"error": "Malformed data"}), 400
-        if pet_name is not None and not isinstance(pet_name, str):
-            return jsonify({"error": "Malformed data"}), 400
-
-        # Validate store is 1 or 2
-        if store is not None and store not in [1, 2]:
-            return jsonify({"error": "Malformed data"}), 400
-
-        # pet-name can only be supplied if store is supplied
-        if pet_name and store is None:
-            return jsonify({"error": "Malformed data"}), 400
-
-        # Find available pet
-        result = find_available_pet(pet_type, store, pet_name)
-        if not result:
-            return jsonify({"error": "No pet of this type is available"}), 400
-
-        # Delete pet from store
-        if not delete_pet_from_store(result["pet_type_id"], result["pet"]["name"], result["store_url"]):
-            return jsonify({"error": "Failed to remove pet from store"}), 500
-
-        # Generate purchase ID
-        purchase_id = str(uuid.uuid4())
-
-        # Create transaction record
-        transaction = {
-            "purchaser": purchaser,
-            "pet-type": pet_type,
-            "store": result["store"],
-            "purchase-id": purchase_id
-        }
-
-        # Save transaction to database
-        transactions_collection.insert_one(transaction)
-
-        # Create purchase response
-        purchase = {
-            "purchaser": purchaser,
-            "pet-type": pet_type,
-            "store": result["store"],
-            "pet-name": result["pet"]["name"],
-            "purchase-id": purchase_id
-        }
-
-        return jsonify(purchase), 201
-
-    except Exception as e:
-        return jsonify({"error": "Server error"}), 500
+    body, error = parse_body(PurchaseBody)
+    if error:
+        return error
+
+    purchaser = body.purchaser.strip()
+    pet_type = body.pet_type.strip()
+    store = body.store
+    pet_name = body.pet_name
+
+    # Validate store is 1 or 2
+    if store is not None and store not in [1, 2]:
+        return jsonify({"error": "Malformed data"}), 400
+
+    # pet-name can only be supplied if store is supplied
+    if pet_name and store is None:
+        return jsonify({"error": "Malformed data"}), 400
+
+    # Find available pet
+    result = find_available_pet(pet_type, store, pet_name)
+    if not result:
+        return jsonify({"error": "No pet of this type is available"}), 400
+
+    # Delete pet from store
+    if not delete_pet_from_store(result["pet_type_id"], result["pet"]["name"], result["store_url"]):
+        return jsonify({"error": "Failed to remove pet from store"}), 500
+
+    # Generate purchase ID
+    purchase_id = str(uuid.uuid4())
+
+    # Create transaction record
+    transaction = {
+        "purchaser": purchaser,
+        "pet-type": pet_type,
+        "store": result["store"],
+        "purchase-id": purchase_id
+    }
+
+    # Save transaction to database
+    transactions_collection().insert_one(transaction)
+
+    # Create purchase response
+    purchase = {
+        "purchaser": purchaser,
+        "pet-type": pet_type,
+        "store": result["store"],
+        "pet-name": result["pet"]["name"],
+        "purchase-id": purchase_id
+    }
+
+    return jsonify(purchase), 201
+
 
 @app.route("/transactions", methods=["GET"])
 def get_transactions():
-    try:
-        # Check authorization header
-        owner_header = request.headers.get("OwnerPC")
-        if owner_header != "LovesPetsL2M3n4":
-            return jsonify({"error": "Unauthorized"}), 401
-
-        # Build query from query parameters
-        query = {}
-        for key, value in request.args.items():
-            if key in ["purchaser", "pet-type", "store", "purchase-id"]:
-                if key == "store":
-                    try:
-                        query[key] = int(value)
-                    except ValueError:
-                        query[key] = value
-                else:
+    # Check authorization header
+    owner_header = request.headers.get("OwnerPC")
+    if owner_header != "LovesPetsL2M3n4":
+        return jsonify({"error": "Unauthorized"}), 401
+
+    # Build query from query parameters
+    query = {}
+    for key, value in request.args.items():
+        if key in ["purchaser", "pet-type", "store", "purchase-id"]:
+            if key == "store":
+                try:
+                    query[key] = int(value)
+                except ValueError:
                     query[key] = value
+            else:
+                query[key] = value
 
-        # Get transactions from database
-        transactions = list(transactions_collection.find(query, {"_id": 0}))
-        return jsonify(transactions), 200
+    # Get transactions from database
+    transactions = list(transactions_collection().find(query, {"_id": 0}))
+    return jsonify(transactions), 200
 
-    except Exception as e:
-        return jsonify({"error": "Server error"}), 500
 
 @app.route('/kill', methods=['GET'])
 def kill_container():
+    # Under gunicorn, exiting here would only take down this one worker and
+    # the master would respawn it; terminate the master so the whole
+    # container stops, like exiting did under the standalone dev server.
+    if os.getenv("SERVER_SOFTWARE", "").startswith("gunicorn"):
+        os.kill(os.getppid(), signal.SIGTERM)
     os._exit(1)
 
+# Dev-only entry point. In the container the app runs under gunicorn with
+# gevent workers (see gunicorn.conf.py):
+#   gunicorn -c gunicorn.conf.py pet_order_service:app
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 5003))
     app.run(host="0.0.0.0", port=port)
\ No newline at end of file
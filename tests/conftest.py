@@ -0,0 +1,315 @@
+import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+# Base URLs for the services
+PET_STORE_1_URL = "http://localhost:5001"
+PET_STORE_2_URL = "http://localhost:5002"
+PET_ORDER_URL = "http://localhost:5003"
+
+# Pre-joined collection endpoints
+S1_TYPES = f"{PET_STORE_1_URL}/pet-types"
+S2_TYPES = f"{PET_STORE_2_URL}/pet-types"
+
+# Pet Types payloads
+PET_TYPE1 = {"type": "Golden Retriever"}
+PET_TYPE2 = {"type": "Australian Shepherd"}
+PET_TYPE3 = {"type": "Abyssinian"}
+PET_TYPE4 = {"type": "bulldog"}
+
+# Expected values for pet types
+PET_TYPE1_VAL = {
+    "type": "Golden Retriever",
+    "family": "Canidae",
+    "genus": "Canis",
+    "attributes": [],
+    "lifespan": 12
+}
+
+PET_TYPE2_VAL = {
+    "type": "Australian Shepherd",
+    "family": "Canidae",
+    "genus": "Canis",
+    "attributes": ["Loyal", "outgoing", "and", "friendly"],
+    "lifespan": 15
+}
+
+PET_TYPE3_VAL = {
+    "type": "Abyssinian",
+    "family": "Felidae",
+    "genus": "Felis",
+    "attributes": ["Intelligent", "and", "curious"],
+    "lifespan": 13
+}
+
+PET_TYPE4_VAL = {
+    "type": "bulldog",
+    "family": "Canidae",
+    "genus": "Canis",
+    "attributes": ["Gentle", "calm", "and", "affectionate"],
+    "lifespan": None
+}
+
+# Pet payloads
+PET1_TYPE1 = {"name": "Lander", "birthdate": "14-05-2020"}
+PET2_TYPE1 = {"name": "Lanky"}
+PET3_TYPE1 = {"name": "Shelly", "birthdate": "07-07-2019"}
+PET4_TYPE2 = {"name": "Felicity", "birthdate": "27-11-2011"}
+PET5_TYPE3 = {"name": "Muscles"}
+PET6_TYPE3 = {"name": "Junior"}
+PET7_TYPE4 = {"name": "Lazy", "birthdate": "07-08-2018"}
+PET8_TYPE4 = {"name": "Lemon", "birthdate": "27-03-2020"}
+
+
+def _body(payload):
+    """Serialize a payload once at import so POSTs send prebuilt bytes
+    (data=...) instead of re-running json.dumps on every call"""
+    return json.dumps(payload).encode()
+
+PET_TYPE1_BODY = _body(PET_TYPE1)
+PET_TYPE2_BODY = _body(PET_TYPE2)
+PET_TYPE3_BODY = _body(PET_TYPE3)
+PET_TYPE4_BODY = _body(PET_TYPE4)
+
+PET1_TYPE1_BODY = _body(PET1_TYPE1)
+PET2_TYPE1_BODY = _body(PET2_TYPE1)
+PET3_TYPE1_BODY = _body(PET3_TYPE1)
+PET4_TYPE2_BODY = _body(PET4_TYPE2)
+PET5_TYPE3_BODY = _body(PET5_TYPE3)
+PET6_TYPE3_BODY = _body(PET6_TYPE3)
+PET7_TYPE4_BODY = _body(PET7_TYPE4)
+PET8_TYPE4_BODY = _body(PET8_TYPE4)
+
+
+def _check_created(response, expected_val):
+    """Assert a pet-type create succeeded and return the new id.
+
+    The enrichment fields are checked as one dict-subset comparison
+    instead of separate per-field asserts.
+    """
+    assert response.status_code == 201, \
+        f"Failed to create {expected_val['type']}: {response.status_code}"
+    data = response.json()
+    expected = {"family": expected_val["family"], "genus": expected_val["genus"]}
+    assert expected.items() <= data.items(), f"mismatch: {data} vs {expected}"
+    return data["id"]
+
+
+def _create_pet_type(http, types_url, pet_type, body, expected_val):
+    """POST a pet-type and return its id, tolerating reruns.
+
+    The stores answer 400 for a duplicate type name, so when the session
+    fixture runs against a database that already holds these types (e.g. a
+    second pytest invocation without wiping MongoDB) we recover the existing
+    id with a filtered GET instead of failing setup.
+    """
+    response = http.post(types_url, data=body)
+    if response.status_code == 400:
+        lookup = http.get(
+            types_url,
+            params={"type": pet_type["type"], "fields": "id,type"}
+        )
+        assert lookup.status_code == 200, f"Failed to look up existing {pet_type['type']}"
+        matches = lookup.json()
+        assert matches, f"Duplicate {pet_type['type']} reported but not found"
+        return matches[0]["id"]
+
+    return _check_created(response, expected_val)
+
+
+def _create_pet(http, pets_url, name, body):
+    """POST a pet, verifying a duplicate-name 400 against the server.
+
+    A 400 only counts as "already created" when a GET confirms the pet
+    really exists, so a server that rejects every create fails setup
+    instead of passing it vacuously.
+    """
+    response = http.post(pets_url, data=body)
+    if response.status_code == 400:
+        lookup = http.get(f"{pets_url}/{name}")
+        assert lookup.status_code == 200, \
+            f"Create of pet {name} rejected but pet not found at {pets_url}"
+        return
+    assert response.status_code == 201, \
+        f"Failed to create pet {name} at {pets_url}"
+
+
+# All six pet-type creates across both stores, tagged with the store's
+# collection endpoint so one thread pool can fan out the whole batch
+_ALL_PET_TYPES = [
+    (S1_TYPES, PET_TYPE1, PET_TYPE1_BODY, PET_TYPE1_VAL, "type1"),
+    (S1_TYPES, PET_TYPE2, PET_TYPE2_BODY, PET_TYPE2_VAL, "type2"),
+    (S1_TYPES, PET_TYPE3, PET_TYPE3_BODY, PET_TYPE3_VAL, "type3"),
+    (S2_TYPES, PET_TYPE1, PET_TYPE1_BODY, PET_TYPE1_VAL, "type1"),
+    (S2_TYPES, PET_TYPE2, PET_TYPE2_BODY, PET_TYPE2_VAL, "type2"),
+    (S2_TYPES, PET_TYPE4, PET_TYPE4_BODY, PET_TYPE4_VAL, "type4")
+]
+
+
+# Opt-in dev-loop cache for the server-assigned type ids: with
+# TEST_REUSE_IDS=1 the ids from a previous run are pickled here and
+# reused after a one-GET-per-id liveness check, skipping the POST phase
+_IDS_CACHE_PATH = "/tmp/assn4_ids.pkl"
+
+
+def _load_cached_ids(http):
+    """Return pickled ids if every one still resolves on its store."""
+    if os.getenv("TEST_REUSE_IDS") != "1":
+        return None
+    try:
+        with open(_IDS_CACHE_PATH, "rb") as f:
+            ids = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+    for (types_url, _key), type_id in ids.items():
+        # Any stale id (404 after a db wipe) invalidates the whole cache
+        if http.get(f"{types_url}/{type_id}").status_code != 200:
+            return None
+    return ids
+
+
+def _save_cached_ids(ids):
+    if os.getenv("TEST_REUSE_IDS") != "1":
+        return
+    try:
+        with open(_IDS_CACHE_PATH, "wb") as f:
+            pickle.dump(ids, f)
+    except OSError:
+        pass
+
+
+@pytest.fixture(scope="session")
+def _all_pet_type_ids(http):
+    """Create every pet-type on both stores in one concurrent batch.
+
+    Store1 and store2 are independent services, so their creates are
+    overlapped in the same pool instead of one store waiting for the
+    other; total setup latency is roughly one round trip, not six.
+    """
+    cached = _load_cached_ids(http)
+    if cached is not None:
+        return cached
+
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        results = ex.map(
+            lambda t: ((t[0], t[4]), _create_pet_type(http, t[0], t[1], t[2], t[3])),
+            _ALL_PET_TYPES
+        )
+        ids = dict(results)
+    _save_cached_ids(ids)
+    return ids
+
+
+@pytest.fixture(scope="session")
+def setup_store1_pet_types(_all_pet_type_ids):
+    """Setup: POST 3 pet-types to pet store #1 and return their IDs"""
+    ids = {key: type_id for (types_url, key), type_id in _all_pet_type_ids.items()
+           if types_url == S1_TYPES}
+
+    # Verify all IDs are unique
+    assert len(ids.values()) == len(set(ids.values())), "IDs should be unique"
+    return ids
+
+
+@pytest.fixture(scope="session")
+def setup_store2_pet_types(_all_pet_type_ids):
+    """Setup: POST 3 pet-types to pet store #2 and return their IDs"""
+    ids = {key: type_id for (types_url, key), type_id in _all_pet_type_ids.items()
+           if types_url == S2_TYPES}
+
+    # Verify all IDs are unique
+    assert len(ids.values()) == len(set(ids.values())), "IDs should be unique"
+    return ids
+
+
+@pytest.fixture(scope="session")
+def setup_pets_store1(http, setup_store1_pet_types):
+    """Setup: POST pets to pet store #1"""
+    ids = setup_store1_pet_types
+
+    # 2 pets of type1 (Golden Retriever), 2 of type3 (Abyssinian); every
+    # pet name is distinct so the four POSTs can run concurrently. The
+    # per-type pets URLs are joined once up front rather than per call.
+    type1_pets = f"{S1_TYPES}/{ids['type1']}/pets"
+    type3_pets = f"{S1_TYPES}/{ids['type3']}/pets"
+    pets = [
+        (type1_pets, PET1_TYPE1["name"], PET1_TYPE1_BODY),
+        (type1_pets, PET2_TYPE1["name"], PET2_TYPE1_BODY),
+        (type3_pets, PET5_TYPE3["name"], PET5_TYPE3_BODY),
+        (type3_pets, PET6_TYPE3["name"], PET6_TYPE3_BODY)
+    ]
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(
+            lambda t: _create_pet(http, t[0], t[1], t[2]),
+            pets
+        ))
+
+    return ids
+
+
+@pytest.fixture(scope="session")
+def setup_pets_store2(http, setup_store2_pet_types):
+    """Setup: POST pets to pet store #2"""
+    ids = setup_store2_pet_types
+
+    # One pet each of type1/type2 plus 2 of type4 (bulldog); every pet
+    # name is distinct so the four POSTs can run concurrently. The
+    # per-type pets URLs are joined once up front rather than per call.
+    type4_pets = f"{S2_TYPES}/{ids['type4']}/pets"
+    pets = [
+        (f"{S2_TYPES}/{ids['type1']}/pets", PET3_TYPE1["name"], PET3_TYPE1_BODY),
+        (f"{S2_TYPES}/{ids['type2']}/pets", PET4_TYPE2["name"], PET4_TYPE2_BODY),
+        (type4_pets, PET7_TYPE4["name"], PET7_TYPE4_BODY),
+        (type4_pets, PET8_TYPE4["name"], PET8_TYPE4_BODY)
+    ]
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(
+            lambda t: _create_pet(http, t[0], t[1], t[2]),
+            pets
+        ))
+
+    return ids
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        default=False,
+        help="Memoize idempotent GETs across reruns with requests-cache"
+    )
+
+
+@pytest.fixture(scope="session")
+def http(pytestconfig):
+    """One requests.Session shared by the whole suite.
+
+    Every test call reuses pooled keep-alive connections per service host
+    instead of paying a fresh DNS + TCP handshake for each of the ~25 HTTP
+    calls, and the JSON content type is set once here instead of at every
+    call site.
+
+    With --use-requests-cache, GET responses are cached on disk for 10
+    minutes so repeated local runs during development skip the network for
+    reads entirely. POSTs are never cached. Requires the requests-cache
+    package; the default run has no extra dependency.
+    """
+    if pytestconfig.getoption("--use-requests-cache"):
+        import requests_cache
+        session = requests_cache.CachedSession(
+            backend="sqlite",
+            cache_name=".cache/requests-cache.sqlite",
+            expire_after=600,
+            allowable_methods=("GET",)
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = requests.adapters.HTTPAdapter(pool_connections=3, pool_maxsize=10)
+    session.mount("http://", adapter)
+    yield session
+    session.close()